@@ -437,6 +437,7 @@ class ApiQueue:
         self.tries = None
         self._retry = False
         self._tsub = 0
+        self._token_counts = [None] * len(request_jsons)
         self._reset()
         self.job_names = [f'job_{str(ijob).zfill(4)}'
                           for ijob in range(len(request_jsons))]
@@ -454,6 +455,16 @@ class ApiQueue:
         """Number of API calls to submit"""
         return len(self.request_jsons)
 
+    def _count_tokens(self, ijob):
+        """Get the token count for a job, counting it only once for the
+        lifetime of the queue (jobs are re-checked on every submission pass
+        and on every retry)."""
+        if self._token_counts[ijob] is None:
+            request = self.request_jsons[ijob]
+            self._token_counts[ijob] = ApiBase.count_tokens(str(request),
+                                                            request['model'])
+        return self._token_counts[ijob]
+
     @property
     def waiting_on(self):
         """Get a list of async jobs that are being waited on."""
@@ -473,8 +484,7 @@ class ApiQueue:
                     and itodo
                     and token_count < avail_tokens):
                 request = self.request_jsons[ijob]
-                model = request['model']
-                tokens = ApiBase.count_tokens(str(request), model)
+                tokens = self._count_tokens(ijob)
 
                 if tokens > self.rate_limit:
                     msg = ('Job index #{} with has {} tokens which '
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """ELM Ordinance county file downloading logic"""
+import asyncio
 import logging
 
 from elm.ords.llm import StructuredLLMCaller
@@ -12,6 +13,8 @@ from elm.web.utilities import filter_documents
 
 
 logger = logging.getLogger(__name__)
+MAX_CONCURRENT_ORD_CHECKS = 8
+"""Maximum number of documents checked for ordinance info concurrently"""
 QUESTION_TEMPLATES = [
     '0. "wind energy conversion system zoning ordinances {location}"',
     '1. "{location} wind WECS zoning ordinance"',
@@ -114,13 +117,13 @@ async def _down_select_docs_correct_location(docs, location, **kwargs):
     """Remove all documents not pertaining to the location."""
     llm_caller = StructuredLLMCaller(**kwargs)
     county_validator = CountyValidator(llm_caller)
-    return await filter_documents(
-        docs,
-        validation_coroutine=county_validator.check,
-        task_name=location.full_name,
-        county=location.name,
-        state=location.state,
+    checks = await asyncio.create_task(
+        county_validator.check_batch(
+            docs, county=location.name, state=location.state
+        ),
+        name=location.full_name,
     )
+    return [doc for doc, check in zip(docs, checks) if check]
 
 
 async def _down_select_docs_correct_content(docs, location, **kwargs):
@@ -129,6 +132,7 @@ async def _down_select_docs_correct_content(docs, location, **kwargs):
         docs,
         validation_coroutine=_contains_ords,
         task_name=location.full_name,
+        max_concurrent=MAX_CONCURRENT_ORD_CHECKS,
         **kwargs,
     )
 
@@ -144,7 +148,8 @@ def _sort_final_ord_docs(all_ord_docs):
     if not all_ord_docs:
         return None
 
-    return sorted(all_ord_docs, key=_ord_doc_sorting_key)[-1]
+    # reversed to match the last-of-ties pick of a stable sort
+    return max(reversed(all_ord_docs), key=_ord_doc_sorting_key)
 
 
 def _ord_doc_sorting_key(doc):
@@ -79,6 +79,93 @@ class URLValidator(FixedMessageValidator):
         "otherwise. `False` if not sure."
     )
 
+    BATCH_SYSTEM_MESSAGE = (
+        "You extract structured data from a numbered list of URLs. Return "
+        "your answer in JSON format. Your JSON file must include exactly one "
+        "key per URL, which is the number of that URL as a string (e.g. "
+        "'1', '2', ...). The value of each key is a JSON object with exactly "
+        "two keys. The first key is 'correct_county', which is a boolean "
+        "that is set to `True` if the URL mentions {county} County in some "
+        "way. DO NOT infer based on information in the URL about any US "
+        "state, city, township, or otherwise. `False` if not sure. The "
+        "second key is 'correct_state', which is a boolean that is set to "
+        "`True` if the URL mentions {state} State in some way. DO NOT infer "
+        "based on information in the URL about any US county, city, "
+        "township, or otherwise. `False` if not sure. Evaluate each URL "
+        "independently of the others."
+    )
+    """LLM system message for validating several URLs in one query."""
+
+    BATCH_SIZE = 4
+    """Maximum number of URLs validated in a single LLM query."""
+
+    async def check_batch(self, urls, county, state):
+        """Check if each URL matches the county, packing several URLs
+        into each LLM query.
+
+        Parameters
+        ----------
+        urls : list of str
+            URLs to validate. Empty entries (e.g. ``None``) fail the
+            validation without being sent to the LLM.
+        county : str
+            County that the URLs should mention.
+        state : str
+            State corresponding to `county` input.
+
+        Returns
+        -------
+        list of bool
+            ``True`` for each URL that passes the validation check,
+            ``False`` otherwise. Same order as the `urls` input.
+
+        Notes
+        -----
+        A batch with a single URL is validated with the regular
+        :meth:`check` query.
+        """
+        to_check = [ind for ind, url in enumerate(urls) if url]
+        batches = [
+            to_check[start:start + self.BATCH_SIZE]
+            for start in range(0, len(to_check), self.BATCH_SIZE)
+        ]
+        outer_task_name = asyncio.current_task().get_name()
+        batch_checks = [
+            asyncio.create_task(
+                self._check_batch(
+                    [urls[ind] for ind in batch], county=county, state=state
+                ),
+                name=outer_task_name,
+            )
+            for batch in batches
+        ]
+
+        out = [False] * len(urls)
+        for batch, checks in zip(batches, await asyncio.gather(*batch_checks)):
+            for ind, check in zip(batch, checks):
+                out[ind] = check
+        return out
+
+    async def _check_batch(self, urls, county, state):
+        """Validate a single batch of URLs with one LLM query"""
+        if len(urls) == 1:
+            return [await self.check(urls[0], county=county, state=state)]
+
+        sys_msg = self.BATCH_SYSTEM_MESSAGE.format(county=county, state=state)
+        content = "\n".join(
+            f"URL {num}: {url}" for num, url in enumerate(urls, start=1)
+        )
+        props = await self.slc.call(
+            sys_msg, content, usage_sub_label="document_location_validation"
+        )
+        out = []
+        for num in range(1, len(urls) + 1):
+            url_props = props.get(str(num))
+            if not isinstance(url_props, dict):
+                url_props = {}
+            out.append(self._parse_output(url_props))
+        return out
+
     def _parse_output(self, props):
         """Parse LLM response and return `True` if the document passes."""
         logger.debug("Parsing URL validation output:\n\t%s", props)
@@ -186,6 +273,8 @@ class CountyValidator:
     async def check(self, doc, county, state):
         """Check if the document belongs to the county.
 
+        This is :meth:`check_batch` applied to a single document.
+
         Parameters
         ----------
         doc : :class:`elm.web.document.BaseDocument`
@@ -204,36 +293,114 @@ class CountyValidator:
             `True` if the doc contents pertain to the input county.
             `False` otherwise.
         """
-        source = doc.attrs.get("source")
-        logger.debug(
-            "Validating document from source: %s", source or "Unknown"
-        )
-        logger.debug("Checking for correct for jurisdiction...")
-        jurisdiction_is_county = await _validator_check_for_doc(
-            validator=self.cj_validator,
-            doc=doc,
-            score_thresh=self.score_thresh,
-            county=county,
-        )
-        if not jurisdiction_is_county:
-            return False
+        out = await self.check_batch([doc], county=county, state=state)
+        return out[0]
 
-        logger.debug(
-            "Checking URL (%s) for county name...", source or "Unknown"
-        )
-        url_is_county = await self.url_validator.check(
-            source, county=county, state=state
-        )
-        if url_is_county:
-            return True
+    async def check_batch(self, docs, county, state):
+        """Check which of the documents belong to the county.
 
+        The validation steps run in order of increasing cost: the
+        jurisdiction check, the URL check, and finally the county name
+        check on the document text (heuristic first, then LLM). The URL
+        checks for all documents that pass the jurisdiction check are
+        packed into as few LLM queries as possible (see
+        :meth:`URLValidator.check_batch`).
+
+        Parameters
+        ----------
+        docs : list of :class:`elm.web.document.BaseDocument`
+            Document instances. Each should contain a "source" key in
+            the metadata that contains a URL (used for the URL
+            validation check). Raw content will be parsed for county
+            name and correct jurisdiction.
+        county : str
+            County that documents should belong to.
+        state : str
+            State corresponding to `county` input.
+
+        Returns
+        -------
+        list of bool
+            `True` for each doc whose contents pertain to the input
+            county, `False` otherwise. Same order as the `docs` input.
+        """
+        # Each step runs for all docs before the next step starts (so a
+        # step waits on the slowest doc) instead of each doc moving through
+        # the steps on its own. This is deliberate: it lets the URL checks
+        # of all docs that pass the jurisdiction check be packed into as
+        # few LLM queries as possible.
+        outer_task_name = asyncio.current_task().get_name()
+        for doc in docs:
+            logger.debug(
+                "Validating document from source: %s",
+                doc.attrs.get("source") or "Unknown",
+            )
+
+        logger.debug("Checking %d docs for correct jurisdiction...", len(docs))
+        jurisdiction_checks = [
+            asyncio.create_task(
+                _validator_check_for_doc(
+                    validator=self.cj_validator,
+                    doc=doc,
+                    score_thresh=self.score_thresh,
+                    county=county,
+                ),
+                name=outer_task_name,
+            )
+            for doc in docs
+        ]
+        out = await asyncio.gather(*jurisdiction_checks)
+        to_check = [ind for ind, check in enumerate(out) if check]
+
+        heuristic_checks = {
+            ind: _start_heuristic_check(docs[ind], county, state)
+            for ind in to_check
+        }
+        try:
+            logger.debug(
+                "Checking %d URLs for county name...", len(to_check)
+            )
+            url_checks = await self.url_validator.check_batch(
+                [docs[ind].attrs.get("source") for ind in to_check],
+                county=county,
+                state=state,
+            )
+            to_check = [
+                ind for ind, check in zip(to_check, url_checks) if not check
+            ]
+
+            text_checks = [
+                asyncio.create_task(
+                    self._check_text(
+                        docs[ind], county, state, heuristic_checks[ind]
+                    ),
+                    name=outer_task_name,
+                )
+                for ind in to_check
+            ]
+            checks = await asyncio.gather(*text_checks)
+        finally:
+            # heuristics of docs that passed the URL check are no longer
+            # needed; cancel them (a thread that already started still
+            # runs to completion) and wait so no task is left pending
+            for heuristic_check in heuristic_checks.values():
+                heuristic_check.cancel()
+            await asyncio.gather(
+                *heuristic_checks.values(), return_exceptions=True
+            )
+
+        for ind, check in zip(to_check, checks):
+            out[ind] = check
+        return out
+
+    async def _check_text(self, doc, county, state, heuristic_check):
+        """Check the document text for the county name"""
+        source = doc.attrs.get("source")
         logger.debug(
             "Checking text for county name (heuristic; URL: %s)...",
             source or "Unknown",
         )
-        correct_county_heuristic = _heuristic_check_for_county_and_state(
-            doc, county, state
-        )
+        correct_county_heuristic = await heuristic_check
         logger.debug(
             "Found county name in text (heuristic): %s",
             correct_county_heuristic,
@@ -254,6 +421,25 @@ class CountyValidator:
         )
 
 
+def _start_heuristic_check(doc, county, state):
+    """Start the county name heuristic in a thread.
+
+    The CPU-bound heuristic runs while the URL LLM check is awaited.
+    Note that a thread that has started cannot be cancelled, so this
+    should only be called once the document has passed the
+    jurisdiction check (i.e. when the heuristic may be needed). The
+    caller owns the returned task: if the heuristic turns out not to
+    be needed (e.g. the URL check passed), the caller must cancel the
+    task and await it (see :meth:`CountyValidator.check_batch`).
+    """
+    return asyncio.create_task(
+        asyncio.to_thread(
+            _heuristic_check_for_county_and_state, doc, county, state
+        ),
+        name=asyncio.current_task().get_name(),
+    )
+
+
 def _heuristic_check_for_county_and_state(doc, county, state):
     """Check if county and state names are in doc"""
     return any(
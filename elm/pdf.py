@@ -5,17 +5,38 @@ ELM PDF to text parser
 """
 import os
 import subprocess
+import time
 import requests
-import tempfile
-import copy
+from requests.adapters import HTTPAdapter
 from PyPDF2 import PdfReader
 import logging
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from elm.base import ApiBase
-from elm.utilities.parse import is_multi_col, combine_pages, clean_headers
+from elm.utilities.parse import (is_multi_col, combine_pages, clean_headers,
+                                 remove_blank_pages)
+
+
+try:
+    # optional faster reader, AGPL-3.0 licensed so not a hard requirement
+    # (the pymupdf module name requires PyMuPDF>=1.24.3)
+    import pymupdf
+except ImportError:
+    pymupdf = None
 
 
 logger = logging.getLogger(__name__)
+_CLEAN_CHARS = ('\n', '.', ',', '-', '/', ':')
+MIN_PAGES_FOR_PARALLEL = 8
+"""Minimum number of pages for parallel PDF loading to be worth the
+process pool overhead."""
+
+
+def _extract_page(fp, i):
+    """Extract the text from a single PDF page (process pool worker)"""
+    with pymupdf.open(fp) as doc:
+        return i, doc[i].get_text("text")
 
 
 class PDFtoTXT(ApiBase):
@@ -33,7 +54,8 @@ class PDFtoTXT(ApiBase):
                          'without comments or added information.')
     """Instructions to the model with python format braces for pdf text"""
 
-    def __init__(self, fp, page_range=None, model=None):
+    def __init__(self, fp, page_range=None, model=None, parallel=False,
+                 max_workers=16):
         """
         Parameters
         ----------
@@ -45,9 +67,27 @@ class PDFtoTXT(ApiBase):
         model : None | str
             Optional specification of OpenAI model to use. Default is
             cls.DEFAULT_MODEL
+        parallel : bool
+            Flag to extract the PDF pages in parallel using a process pool.
+            This is only applied to PDFs with at least
+            MIN_PAGES_FOR_PARALLEL pages and requires the optional PyMuPDF
+            package, version 1.24.3 or later
+            (``pip install NREL-elm[pymupdf]``).
+        max_workers : int
+            Default maximum number of threads (concurrent API calls) used
+            by :meth:`clean_txt`. This also sets the size of the HTTP
+            connection pool used for those API calls.
         """
         super().__init__(model)
         self.fp = fp
+        self.parallel = parallel
+        self.max_workers = max_workers
+        self._session = requests.Session()
+        # one pooled connection per clean_txt thread so that concurrent
+        # page requests reuse open connections
+        adapter = HTTPAdapter(pool_maxsize=max_workers)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
         self.raw_pages = self.load_pdf(page_range)
         self.pages = self.raw_pages
         self.full = combine_pages(self.raw_pages)
@@ -70,7 +110,6 @@ class PDFtoTXT(ApiBase):
 
         logger.info('Loading PDF: {}'.format(self.fp))
         out = []
-        pdf = PdfReader(self.fp)
 
         if page_range is not None:
             assert len(page_range) == 2
@@ -78,17 +117,57 @@ class PDFtoTXT(ApiBase):
         else:
             page_range = slice(0, None)
 
-        for i, page in enumerate(pdf.pages[page_range]):
-            page_text = page.extract_text()
+        if pymupdf is None:
+            n_pages, indices, page_texts = self._load_pages_pypdf2(page_range)
+        else:
+            n_pages, indices, page_texts = self._load_pages_pymupdf(
+                page_range)
+
+        for i, page_text in zip(indices, page_texts):
             if len(page_text.strip()) == 0:
                 logger.debug('Skipping empty page {} out of {}'
-                             .format(i + 1 + page_range.start, len(pdf.pages)))
+                             .format(i + 1, n_pages))
             else:
                 out.append(page_text)
 
         logger.info('Finished loading PDF.')
         return out
 
+    def _load_pages_pypdf2(self, page_range):
+        """Extract the text of the pages in page_range using PyPDF2"""
+        if self.parallel:
+            logger.warning('Parallel PDF loading requires the optional '
+                           'PyMuPDF package, loading pages serially.')
+
+        pdf = PdfReader(self.fp)
+        n_pages = len(pdf.pages)
+        indices = range(*page_range.indices(n_pages))
+        page_texts = [pdf.pages[i].extract_text() for i in indices]
+        return n_pages, indices, page_texts
+
+    def _load_pages_pymupdf(self, page_range):
+        """Extract the text of the pages in page_range using PyMuPDF"""
+        doc = pymupdf.open(self.fp)
+        try:
+            n_pages = doc.page_count
+            indices = range(*page_range.indices(n_pages))
+            use_pool = (self.parallel
+                        and len(indices) >= MIN_PAGES_FOR_PARALLEL)
+            if not use_pool:
+                page_texts = [doc[i].get_text("text") for i in indices]
+        finally:
+            doc.close()
+
+        if use_pool:
+            page_texts = [None] * len(indices)
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as exe:
+                results = exe.map(partial(_extract_page, self.fp), indices,
+                                  chunksize=4)
+                for i, page_text in results:
+                    page_texts[indices.index(i)] = page_text
+
+        return n_pages, indices, page_texts
+
     def make_gpt_messages(self, pdf_raw_text):
         """Make the chat completion messages list for input to GPT
 
@@ -112,39 +191,91 @@ class PDFtoTXT(ApiBase):
 
         return messages
 
-    def clean_txt(self):
-        """Use GPT to clean raw pdf text in serial calls to the OpenAI API.
+    def _clean_page(self, raw_page, page_num, max_retries=10):
+        """Use GPT to clean a single raw pdf page with a blocking API call.
+
+        Parameters
+        ----------
+        raw_page : str
+            Raw PDF page text to be cleaned
+        page_num : int
+            Page number (1-indexed) used for logging.
+        max_retries : int
+            Number of times to retry an API call with an error response
+            (e.g. a rate limit error) before raising an error.
 
         Returns
         -------
-        clean_pages : list
-            List of clean text strings where each list entry is a page from the
-            PDF
+        content : str
+            Clean page text
         """
+        msg = self.make_gpt_messages(raw_page)
+        req = {"model": self.model, "messages": msg, "temperature": 0.0}
 
-        logger.info('Cleaning PDF text...')
-        clean_pages = []
-
-        for i, raw_page in enumerate(self.raw_pages):
-            msg = self.make_gpt_messages(copy.deepcopy(raw_page))
-            req = {"model": self.model, "messages": msg, "temperature": 0.0}
-
-            kwargs = dict(url=self.URL, headers=self.HEADERS, json=req)
-
+        for attempt in range(max_retries + 1):
             try:
-                response = requests.post(**kwargs)
+                response = self._session.post(url=self.URL,
+                                              headers=self.HEADERS, json=req)
                 response = response.json()
             except Exception as e:
                 msg = 'Error in OpenAI API call!'
                 logger.exception(msg)
                 response = {'error': str(e)}
 
-            choice = response.get('choices', [{'message': {'content': ''}}])[0]
-            message = choice.get('message', {'content': ''})
-            content = message.get('content', '')
-            clean_pages.append(content)
-            logger.debug('Cleaned page {} out of {}'
-                         .format(i + 1, len(self.raw_pages)))
+            if 'error' not in response:
+                break
+
+            logger.error('Received API error for page {} out of {} '
+                         '(attempt {}). Error message: {}'
+                         .format(page_num, len(self.raw_pages), attempt + 1,
+                                 response))
+            if attempt < max_retries:
+                time.sleep(10)
+        else:
+            msg = (f'Hit {max_retries} retries on API query for page '
+                   f'{page_num}. Stopping.')
+            logger.error(msg)
+            raise RuntimeError(msg)
+
+        choice = response.get('choices', [{'message': {'content': ''}}])[0]
+        message = choice.get('message', {'content': ''})
+        content = message.get('content', '')
+        logger.debug('Cleaned page {} out of {}'
+                     .format(page_num, len(self.raw_pages)))
+        return content
+
+    def clean_txt(self, max_workers=None, max_retries=10):
+        """Use GPT to clean raw pdf text in threaded calls to the OpenAI API.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Maximum number of threads (concurrent API calls) used to clean
+            the pages. Defaults to the `max_workers` set at initialization,
+            which also sizes the HTTP connection pool. Larger values still
+            work, but connections beyond the pool size are discarded after
+            each request instead of being reused.
+        max_retries : int
+            Number of times to retry a page API call with an error response
+            (e.g. a rate limit error from too many concurrent calls) before
+            raising an error.
+
+        Returns
+        -------
+        clean_pages : list
+            List of clean text strings where each list entry is a page from the
+            PDF
+        """
+
+        logger.info('Cleaning PDF text...')
+
+        max_workers = max_workers or self.max_workers
+        max_workers = max(1, min(max_workers, len(self.raw_pages)))
+        page_nums = range(1, len(self.raw_pages) + 1)
+        clean_page = partial(self._clean_page, max_retries=max_retries)
+        with ThreadPoolExecutor(max_workers=max_workers) as exe:
+            clean_pages = list(exe.map(clean_page, self.raw_pages,
+                                       page_nums))
 
         logger.info('Finished cleaning PDF.')
 
@@ -226,70 +357,49 @@ class PDFtoTXT(ApiBase):
             Joined cleaned pages
         """
 
-        with tempfile.TemporaryDirectory() as td:
-            fp_out = os.path.join(td, 'poppler_out.txt')
-            args = ['pdftotext', f"{self.fp}", f"{fp_out}"]
-            if layout:
-                args.insert(1, '-layout')
-
-            if not os.path.exists(os.path.dirname(fp_out)):
-                os.makedirs(os.path.dirname(fp_out), exist_ok=True)
-
-            try:
-                stdout = subprocess.run(args, check=True,
-                                        stdout=subprocess.PIPE)
-            except Exception as e:
-                msg = ('PDF cleaning with poppler failed! This usually '
-                       'because you have not installed the poppler utility '
-                       '(see https://poppler.freedesktop.org/). '
-                       f'Full error: {e}')
+        args = ['pdftotext', f"{self.fp}", '-']
+        if layout:
+            args.insert(1, '-layout')
+
+        try:
+            stdout = subprocess.run(args, check=True, stdout=subprocess.PIPE)
+        except Exception as e:
+            msg = ('PDF cleaning with poppler failed! This usually '
+                   'because you have not installed the poppler utility '
+                   '(see https://poppler.freedesktop.org/). '
+                   f'Full error: {e}')
+            logger.exception(msg)
+            raise RuntimeError(msg) from e
+        else:
+            if stdout.returncode != 0:
+                msg = ('Poppler raised return code {}: {}'
+                       .format(stdout.returncode, stdout))
                 logger.exception(msg)
-                raise RuntimeError(msg) from e
-            else:
-                if stdout.returncode != 0:
-                    msg = ('Poppler raised return code {}: {}'
-                           .format(stdout.returncode, stdout))
-                    logger.exception(msg)
-                    raise RuntimeError(msg)
+                raise RuntimeError(msg)
 
-            with open(fp_out, 'r') as f:
-                clean_txt = f.read()
+        clean_txt = stdout.stdout.decode('utf-8', errors='replace')
 
         # break on poppler page break
-        self.pages = clean_txt.split('\x0c')
-        remove = []
-        for i, page in enumerate(self.pages):
-            if not any(page.strip()):
-                remove.append(i)
-        for i in remove[::-1]:
-            _ = self.pages.pop(i)
-
+        self.pages = remove_blank_pages(clean_txt.split('\x0c'))
         self.full = combine_pages(self.pages)
 
         return self.full
 
     def validate_clean(self):
         """Run some basic checks on the GPT cleaned text vs. the raw text"""
-        repl = ('\n', '.', ',', '-', '/', ':')
-
         if not any(self.full.replace('\n', '').strip()):
             msg = 'Didnt get ANY clean output text!'
             logger.error(msg)
             raise RuntimeError(msg)
 
-        def replace_chars_for_clean(text):
-            for char in repl:
+        def clean_words(text):
+            for char in _CLEAN_CHARS:
                 text = text.replace(char, ' ')
-            return text
+            return {x for x in text.split() if len(x) > 2}
 
         for i, (raw, clean) in enumerate(zip(self.raw_pages, self.pages)):
-            raw_words = replace_chars_for_clean(raw).split(' ')
-            clean_words = replace_chars_for_clean(clean).split(' ')
-
-            raw_words = {x for x in raw_words if len(x) > 2}
-            clean_words = {x for x in clean_words if len(x) > 2}
-
-            isin = sum(x in clean_words for x in raw_words)
+            raw_words = clean_words(raw)
+            isin = len(raw_words & clean_words(clean))
 
             perc = 100
             if isin > 0 and len(raw_words) > 0:
@@ -4,6 +4,7 @@ Research Summarization and Distillation with LLMs
 """
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from elm.base import ApiBase
 from elm.chunk import Chunker
@@ -84,7 +85,27 @@ class Summary(ApiBase):
         text_summary = self.generic_query(query, model_role=role)
         return text_summary
 
-    def run(self, temperature=0, fancy_combine=True):
+    def _chunk_queries(self):
+        """Get the summary query for every text chunk
+
+        Returns
+        -------
+        queries : list
+            List of summary queries (str), one for each text chunk.
+        """
+        n_words = self.n_words
+        return [self.MODEL_INSTRUCTION.format(text_chunk=chunk,
+                                              n_words=n_words)
+                for chunk in self.text_chunks]
+
+    def _summarize_chunk(self, msg, chunk_num, temperature=0):
+        """Summarize a single text chunk with a blocking API call"""
+        logger.debug('Summarizing text chunk {} out of {}'
+                     .format(chunk_num, len(self.text_chunks)))
+        return self.generic_query(msg, model_role=self.MODEL_ROLE,
+                                  temperature=temperature)
+
+    def run(self, temperature=0, fancy_combine=True, max_workers=8):
         """Use GPT to do a summary of input text.
 
         Parameters
@@ -95,7 +116,11 @@ class Summary(ApiBase):
             more creative freedom and may not return as factual of results.
         fancy_combine : bool
             Flag to use the GPT model to combine the separate outputs into a
-            cohesive summary.
+            cohesive summary. This is skipped if there is only one text
+            chunk.
+        max_workers : int
+            Maximum number of threads (concurrent API calls) used to
+            summarize the text chunks. Use 1 to summarize in serial.
 
         Returns
         -------
@@ -103,22 +128,21 @@ class Summary(ApiBase):
             Summary of text.
         """
 
-        logger.info('Summarizing {} text chunks in serial...'
-                    .format(len(self.text_chunks)))
-        summary = ''
+        logger.info('Summarizing {} text chunks with up to {} threads...'
+                    .format(len(self.text_chunks), max_workers))
 
-        for i, chunk in enumerate(self.text_chunks):
-            logger.debug('Summarizing text chunk {} out of {}'
-                         .format(i + 1, len(self.text_chunks)))
+        queries = self._chunk_queries()
+        max_workers = max(1, min(max_workers, len(queries)))
+        with ThreadPoolExecutor(max_workers=max_workers) as exe:
+            futures = [exe.submit(self._summarize_chunk, msg, i + 1,
+                                  temperature=temperature)
+                       for i, msg in enumerate(queries)]
+            responses = [future.result() for future in futures]
 
-            msg = self.MODEL_INSTRUCTION.format(text_chunk=chunk,
-                                                n_words=self.n_words)
-            response = self.generic_query(msg, model_role=self.MODEL_ROLE,
-                                          temperature=temperature)
-            self.summary_chunks.append(response)
-            summary += f'\n\n{response}'
+        self.summary_chunks.extend(responses)
+        summary = '\n\n'.join(responses)
 
-        if fancy_combine:
+        if fancy_combine and len(responses) > 1:
             summary = self.combine(summary)
 
         logger.info('Finished all summaries.')
@@ -149,7 +173,8 @@ class Summary(ApiBase):
             input side and assume the output is about the same count.
         fancy_combine : bool
             Flag to use the GPT model to combine the separate outputs into a
-            cohesive summary.
+            cohesive summary. This is skipped if there is only one text
+            chunk.
 
         Returns
         -------
@@ -160,12 +185,7 @@ class Summary(ApiBase):
         logger.info('Summarizing {} text chunks asynchronously...'
                     .format(len(self.text_chunks)))
 
-        queries = []
-        for chunk in self.text_chunks:
-            msg = self.MODEL_INSTRUCTION.format(text_chunk=chunk,
-                                                n_words=self.n_words)
-            queries.append(msg)
-
+        queries = self._chunk_queries()
         summaries = await self.generic_async_query(queries,
                                                    model_role=self.MODEL_ROLE,
                                                    temperature=temperature,
@@ -175,7 +195,7 @@ class Summary(ApiBase):
         self.summary_chunks = summaries
         summary = '\n\n'.join(summaries)
 
-        if fancy_combine:
+        if fancy_combine and len(summaries) > 1:
             summary = self.combine(summary)
 
         logger.info('Finished all summaries.')
@@ -176,32 +176,14 @@ def clean_headers(
     logger.info("Cleaning headers")
     headers = _get_nominal_headers(pages, split_on, iheaders)
     tests = np.zeros((len(pages), len(headers)))
+    page_lines = [page.split(split_on) for page in pages]
 
-    for ip, page in enumerate(pages):
-        for ih, header in zip(iheaders, headers):
-            pheader = ""
-            try:
-                pheader = page.split(split_on)[ih]
-            except IndexError:
-                pass
-
-            harr = header.replace(" ", "")
-            parr = pheader.replace(" ", "")
-
-            harr = harr.ljust(len(parr))
-            parr = parr.ljust(len(harr))
-
-            harr = np.array([*harr])
-            parr = np.array([*parr])
-            assert len(harr) == len(parr)
-
-            test = harr == parr
-            if len(test) == 0:
-                test = 1.0
-            else:
-                test = test.sum() / len(test)
-
-            tests[ip, ih] = test
+    for col, (ih, header) in enumerate(zip(iheaders, headers)):
+        page_headers = [
+            lines[ih] if -len(lines) <= ih < len(lines) else ""
+            for lines in page_lines
+        ]
+        tests[:, col] = _char_match_ratios(header, page_headers)
 
     logger.debug("Header tests (page, iheader): \n{}".format(tests))
     tests = (tests > char_thresh).sum(axis=0) / len(pages)
@@ -214,22 +196,60 @@ def clean_headers(
     if not header_inds_to_remove:
         return pages
 
-    for ip, page in enumerate(pages):
-        page = page.split(split_on)
-        if len(iheaders) >= len(page):
+    for ip, lines in enumerate(page_lines):
+        n_lines = len(lines)
+        if len(iheaders) >= n_lines:
             continue
+        line_inds_to_remove = {
+            ind % n_lines
+            for ind in header_inds_to_remove
+            if -n_lines <= ind < n_lines
+        }
         pages[ip] = split_on.join(
             [
                 line
-                for line_ind, line in enumerate(page)
-                if line_ind not in header_inds_to_remove
-                and line_ind - len(page) not in header_inds_to_remove
+                for line_ind, line in enumerate(lines)
+                if line_ind not in line_inds_to_remove
             ]
         )
 
     return pages
 
 
+def _char_match_ratios(header, page_headers):
+    """Fraction of matching characters between a header and each page header.
+
+    Spaces are ignored and characters past the end of the shorter of
+    the two headers always count as mismatches. All page headers are
+    compared at once as rows of a single padded array of unicode code
+    points.
+    """
+    header = header.replace(" ", "")
+    page_headers = [text.replace(" ", "") for text in page_headers]
+    p_lens = np.array([len(text) for text in page_headers], dtype=int)
+    n_cols = max(len(header), p_lens.max(initial=0))
+    if n_cols == 0:
+        return np.ones(len(page_headers))
+
+    harr = _char_codes(header.ljust(n_cols))
+    parr = _char_codes("".join(text.ljust(n_cols) for text in page_headers))
+    parr = parr.reshape(len(page_headers), n_cols)
+
+    n_common = np.minimum(p_lens, len(header))
+    in_common = np.arange(n_cols) < n_common[:, None]
+    matches = np.count_nonzero((parr == harr) & in_common, axis=1)
+
+    n_chars = np.maximum(p_lens, len(header))
+    return np.divide(matches, n_chars, out=np.ones(len(page_headers)),
+                     where=n_chars > 0)
+
+
+def _char_codes(text):
+    """Convert text to an array of unicode code points"""
+    text = text.encode("utf-32-le", "surrogatepass")
+    return np.frombuffer(text, dtype="<u4")
+
+
 def _get_nominal_headers(pages, split_on, iheaders):
     """Get nominal headers from a standard page.
 
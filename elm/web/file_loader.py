@@ -154,19 +154,27 @@ class AsyncFileLoader:
             List of documents, one per requested URL.
         """
         outer_task_name = asyncio.current_task().get_name()
-        fetches = [
-            asyncio.create_task(self.fetch(url), name=outer_task_name)
-            for url in urls
-        ]
-        return await asyncio.gather(*fetches)
-
-    async def fetch(self, url):
+        async with aiohttp.ClientSession() as session:
+            fetches = [
+                asyncio.create_task(
+                    self.fetch(url, session=session), name=outer_task_name
+                )
+                for url in urls
+            ]
+            return await asyncio.gather(*fetches)
+
+    async def fetch(self, url, session=None):
         """Fetch a document for the given URL.
 
         Parameters
         ----------
         url : str
             URL for the document to pull down.
+        session : :class:`aiohttp.ClientSession`, optional
+            Open client session to use for the GET request. Sharing a
+            session across fetches reuses its connection pool. If
+            ``None``, a new session is opened for this fetch.
+            By default, ``None``.
 
         Returns
         -------
@@ -174,25 +182,26 @@ class AsyncFileLoader:
             Document instance containing text, if the fetch was
             successful.
         """
-        doc, raw_content = await self._fetch_doc_with_url_in_metadata(url)
+        doc, raw_content = await self._fetch_doc_with_url_in_metadata(
+            url, session
+        )
         doc = await self._cache_doc(doc, raw_content)
         return doc
 
-    async def _fetch_doc_with_url_in_metadata(self, url):
+    async def _fetch_doc_with_url_in_metadata(self, url, session=None):
         """Fetch doc contents and add URL to metadata"""
-        doc, raw_content = await self._fetch_doc(url)
+        doc, raw_content = await self._fetch_doc(url, session)
         doc.attrs["source"] = url
         return doc, raw_content
 
-    async def _fetch_doc(self, url):
+    async def _fetch_doc(self, url, session=None):
         """Fetch a doc by trying pdf read, then HTML read, then PDF OCR"""
 
-        async with aiohttp.ClientSession() as session:
-            try:
-                logger.trace("Fetching content from %r", url)
-                url_bytes = await self._fetch_content_with_retry(url, session)
-            except ELMRuntimeError:
-                return PDFDocument(pages=[]), None
+        try:
+            logger.trace("Fetching content from %r", url)
+            url_bytes = await self._fetch_content(url, session)
+        except ELMRuntimeError:
+            return PDFDocument(pages=[]), None
 
         logger.trace("Got content from %r", url)
         doc = await self.pdf_read_coroutine(url_bytes, **self.pdf_read_kwargs)
@@ -214,6 +223,14 @@ class AsyncFileLoader:
 
         return doc, url_bytes
 
+    async def _fetch_content(self, url, session=None):
+        """Fetch content from URL, opening a session if needed"""
+        if session is not None:
+            return await self._fetch_content_with_retry(url, session)
+
+        async with aiohttp.ClientSession() as session:
+            return await self._fetch_content_with_retry(url, session)
+
     @async_retry_with_exponential_backoff(
         base_delay=2,
         exponential_base=1.5,
@@ -4,7 +4,7 @@ import pprint
 import asyncio
 import logging
 from collections import namedtuple
-from itertools import zip_longest, chain
+from itertools import zip_longest, chain, islice
 from contextlib import AsyncExitStack
 
 
@@ -151,46 +151,51 @@ async def _single_se_search(se_name, queries, num_urls, ignore_url_parts,
 
 
 async def _run_search(se_name, queries, browser_sem, task_name, kwargs):
-    """Run a search for multiple queries on a single search engine"""
-    searchers = [asyncio.create_task(_single_query_search(se_name, query,
-                                                          browser_sem, kwargs),
-                                     name=task_name) for query in queries]
-    return await asyncio.gather(*searchers)
+    """Run a search for multiple queries on a single search engine
+
+    A single search engine instance is used for all queries so that
+    browser-based engines only launch one browser (under a single
+    `browser_sem` slot) that is shared by all the query searches.
+    """
+    searcher = asyncio.create_task(_multi_query_search(se_name, queries,
+                                                       browser_sem, kwargs),
+                                   name=task_name)
+    return await searcher
 
 
-async def _single_query_search(se_name, query, browser_sem, kwargs):
-    """Execute a single search query on a single search engine"""
+async def _multi_query_search(se_name, queries, browser_sem, kwargs):
+    """Execute multiple search queries on a single search engine"""
     try:
         search_engine, uses_browser = _init_se(se_name, kwargs)
     except Exception as e:
         logger.error("Could not instantiate %s", se_name)
         logger.exception(e)
-        return [[]]
+        return [[] for __ in queries]
 
     if uses_browser:
-        return await _single_query_pw(search_engine, query,
-                                      browser_sem=browser_sem)
+        return await _multi_query_pw(search_engine, queries,
+                                     browser_sem=browser_sem)
 
-    return await _single_query_api(search_engine, query)
+    return await _multi_query_api(search_engine, queries)
 
 
-async def _single_query_pw(search_engine, question, browser_sem):
-    """Perform a single browser-based search"""
+async def _multi_query_pw(search_engine, queries, browser_sem):
+    """Perform browser-based searches using a single browser"""
     if browser_sem is None:
         browser_sem = AsyncExitStack()
 
-    logger.trace("Single search browser_semaphore=%r", browser_sem)
+    logger.trace("Multi-query search browser_semaphore=%r", browser_sem)
     async with browser_sem:
         logger.trace("Starting %s search for %r with browser_semaphore=%r",
-                     search_engine._SE_NAME, question, browser_sem)
-        return await search_engine.results(question,
+                     search_engine._SE_NAME, queries, browser_sem)
+        return await search_engine.results(*queries,
                                            num_results=_RESULTS_PER_QUERY)
 
 
-async def _single_query_api(search_engine, question):
-    """Perform a single api-based search"""
-    logger.trace("Starting %s search for %r", search_engine._SE_NAME, question)
-    return await search_engine.results(question,
+async def _multi_query_api(search_engine, queries):
+    """Perform api-based searches"""
+    logger.trace("Starting %s search for %r", search_engine._SE_NAME, queries)
+    return await search_engine.results(*queries,
                                        num_results=_RESULTS_PER_QUERY)
 
 
@@ -207,17 +212,11 @@ def _init_se(se_name, kwargs):
 def _down_select_urls(search_results, num_urls=5, ignore_url_parts=None):
     """Select the top N URLs"""
     ignore_url_parts = _as_set(ignore_url_parts)
-    all_urls = chain.from_iterable(zip_longest(*[results[0]
-                                                 for results
-                                                 in search_results]))
-    urls = set()
-    for url in all_urls:
-        if not url or any(substr in url for substr in ignore_url_parts):
-            continue
-        urls.add(url)
-        if len(urls) == num_urls:
-            break
-    return urls
+    all_urls = chain.from_iterable(zip_longest(*search_results))
+    urls = dict.fromkeys(url for url in all_urls
+                         if url and not any(substr in url
+                                            for substr in ignore_url_parts))
+    return set(islice(urls, num_urls))
 
 
 def _as_set(user_input):
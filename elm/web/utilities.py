@@ -6,7 +6,7 @@ import logging
 import asyncio
 from pathlib import Path
 from random import uniform, randint
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, AsyncExitStack
 
 from slugify import slugify
 from fake_useragent import UserAgent
@@ -231,7 +231,8 @@ async def _intercept_route(route):  # pragma: no cover
 
 
 async def filter_documents(
-    documents, validation_coroutine, task_name=None, **kwargs
+    documents, validation_coroutine, task_name=None, max_concurrent=None,
+    **kwargs
 ):
     """Filter documents by applying a filter function to each.
 
@@ -248,6 +249,10 @@ async def filter_documents(
     task_name : str, optional
         Optional task name to use in :func:`asyncio.create_task`.
         By default, ``None``.
+    max_concurrent : int, optional
+        Maximum number of `validation_coroutine` calls allowed to run
+        concurrently. If ``None``, all documents are validated at
+        once. By default, ``None``.
     **kwargs
         Keyword-argument pairs to pass to `validation_coroutine`. This
         should not include the document instance itself, which will be
@@ -259,10 +264,17 @@ async def filter_documents(
         List of documents that passed the validation check, sorted by
         text length, with PDF documents taking the highest precedence.
     """
+    if max_concurrent is None:
+        semaphore = AsyncExitStack()
+    else:
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def _validate(doc):
+        async with semaphore:
+            return await validation_coroutine(doc, **kwargs)
+
     searchers = [
-        asyncio.create_task(
-            validation_coroutine(doc, **kwargs), name=task_name
-        )
+        asyncio.create_task(_validate(doc), name=task_name)
         for doc in documents
     ]
     output = await asyncio.gather(*searchers)
@@ -50,6 +50,7 @@ setup(
     install_requires=install_requires,
     extras_require={
         "dev": install_requires + test_requires,
+        "pymupdf": ["PyMuPDF>=1.24.3"],
     },
     entry_points={"console_scripts": ["elm=elm.cli:main"]}
 )
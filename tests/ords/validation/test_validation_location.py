@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """Test ELM Ordinance location validation tests. """
 import os
+import time
+import asyncio
 from pathlib import Path
 from functools import partial
 
@@ -15,6 +17,7 @@ from elm.ords.llm import StructuredLLMCaller
 from elm.ords.services.openai import OpenAIService
 from elm.ords.services.provider import RunningAsyncServices
 from elm.ords.utilities import RTS_SEPARATORS
+from elm.ords.validation import location
 from elm.ords.validation.location import (
     CountyValidator,
     CountyNameValidator,
@@ -282,5 +285,163 @@ async def test_doc_matches_county(
         assert out == truth
 
 
+@pytest.mark.skipif(SHOULD_SKIP, reason="requires Azure OpenAI key")
+@pytest.mark.asyncio
+async def test_docs_match_county_batch(
+    oai_async_azure_client, structured_llm_caller
+):
+    """Test the `CountyValidator.check_batch` method (basic execution)"""
+    docs = []
+    for fn, url in [
+        (
+            "Decatur Indiana.pdf",
+            "http://www.decaturcounty.in.gov/doc/area-plan-commission/z.pdf",
+        ),
+        ("indiana_general_ord.pdf", "http://www.test.gov"),
+        ("Hamlin South Dakota.pdf", "http://www.test.gov"),
+    ]:
+        with open(Path(TEST_DATA_DIR) / fn, "rb") as fh:
+            doc = PDFDocument(read_pdf(fh.read()))
+        doc.attrs["source"] = url
+        docs.append(doc)
+
+    county_validator = CountyValidator(structured_llm_caller)
+    services = [OpenAIService(oai_async_azure_client, rate_limit=100_000)]
+    async with RunningAsyncServices(services):
+        out = await county_validator.check_batch(
+            docs, county="Decatur", state="Indiana"
+        )
+        assert out == [True, False, False]
+
+
+class _MockStructuredCaller:
+    """Mock structured LLM caller for the `CountyValidator` steps"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def call(self, sys_msg, content, usage_sub_label="default"):
+        """Mock structured LLM call"""
+        if sys_msg == CountyJurisdictionValidator.SYSTEM_MESSAGE.format(
+            county="Decatur"
+        ):
+            self.calls.append(("jurisdiction", content))
+            return {"x": "other jurisdiction" in content, "y": False}
+        if "numbered list of URLs" in sys_msg:
+            self.calls.append(("url_batch", content))
+            out = {}
+            for line in content.split("\n"):
+                num, url = line.removeprefix("URL ").split(": ")
+                correct = "good" in url
+                out[num] = {
+                    "correct_county": correct,
+                    "correct_state": correct,
+                }
+            return out
+        if "from a URL" in sys_msg:
+            self.calls.append(("url", content))
+            correct = "good" in content
+            return {"correct_county": correct, "correct_state": correct}
+
+        self.calls.append(("name", content))
+        return {"wrong_county": "wrong county" in content}
+
+
+def _mock_county_docs():
+    """Docs exercising each step of the `CountyValidator` checks"""
+    return [
+        HTMLDocument(["other jurisdiction text"], attrs={"source": "good1"}),
+        HTMLDocument(["some text"], attrs={"source": "good2"}),
+        HTMLDocument(["Decatur Indiana text"], attrs={"source": "bad"}),
+        HTMLDocument(["wrong county text"], attrs={"source": "bad"}),
+    ]
+
+
+@pytest.fixture()
+def heuristic_docs(monkeypatch):
+    """Mock the county name heuristic and record the docs it starts on"""
+    started = []
+    to_thread = asyncio.to_thread
+
+    def _mock_heuristic(doc, county, state):
+        if "some text" in doc.text:
+            # doc passes the URL check, so this heuristic is never used
+            time.sleep(0.5)
+        return f"{county} {state}" in doc.text
+
+    def _recording_to_thread(func, doc, *args):
+        started.append(doc.text)
+        return to_thread(func, doc, *args)
+
+    monkeypatch.setattr(
+        location, "_heuristic_check_for_county_and_state", _mock_heuristic
+    )
+    monkeypatch.setattr(location.asyncio, "to_thread", _recording_to_thread)
+    return started
+
+
+@pytest.mark.asyncio
+async def test_county_validator_step_order(heuristic_docs):
+    """Test `CountyValidator.check` with mocked LLM calls"""
+    slc = _MockStructuredCaller()
+    county_validator = CountyValidator(slc)
+    out = [
+        await county_validator.check(doc, county="Decatur", state="Indiana")
+        for doc in _mock_county_docs()
+    ]
+
+    assert out == [False, True, True, False]
+    assert len(heuristic_docs) == 3
+    assert not any("other jurisdiction" in text for text in heuristic_docs)
+    assert [content for kind, content in slc.calls if kind == "url"] == [
+        "good2",
+        "bad",
+        "bad",
+    ]
+    assert [content for kind, content in slc.calls if kind == "name"] == [
+        "wrong county text"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_county_validator_check_batch(heuristic_docs):
+    """Test `CountyValidator.check_batch` with mocked LLM calls"""
+    slc = _MockStructuredCaller()
+    county_validator = CountyValidator(slc)
+    docs = _mock_county_docs()[::-1]
+    out = await county_validator.check_batch(
+        docs, county="Decatur", state="Indiana"
+    )
+
+    assert out == [False, True, True, False]
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+    assert [kind for kind, __ in slc.calls].count("jurisdiction") == 4
+    assert len(heuristic_docs) == 3
+    assert not any("other jurisdiction" in text for text in heuristic_docs)
+    assert [(kind, content) for kind, content in slc.calls
+            if kind.startswith("url")] == [
+        ("url_batch", "URL 1: bad\nURL 2: bad\nURL 3: good2"),
+    ]
+    assert [content for kind, content in slc.calls if kind == "name"] == [
+        "wrong county text"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_url_validator_check_batch():
+    """Test that `URLValidator.check_batch` packs URLs into few queries"""
+    urls = ["good1", "bad1", None, "good2", "bad2", "good3", ""]
+    slc = _MockStructuredCaller()
+    url_validator = URLValidator(slc)
+    url_validator.BATCH_SIZE = 2
+    out = await url_validator.check_batch(urls, county="A", state="B")
+
+    assert out == [True, False, False, True, False, True, False]
+    assert slc.calls == [
+        ("url_batch", "URL 1: good1\nURL 2: bad1"),
+        ("url_batch", "URL 1: good2\nURL 2: bad2"),
+        ("url", "good3"),
+    ]
+
 if __name__ == "__main__":
     pytest.main(["-q", "--show-capture=all", Path(__file__), "-rapP"])
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Test ELM API base utilities
+"""
+import asyncio
+
+import elm.base
+from elm.base import ApiBase, ApiQueue
+
+
+def test_api_queue_counts_tokens_once(monkeypatch):
+    """Test that retried jobs do not re-count their tokens"""
+
+    calls = []
+    n_counts = []
+
+    async def _mock_call_api(url, headers, request_json):
+        calls.append(request_json)
+        if len(calls) == 1:
+            return {'error': 'dummy error'}
+        return {'choices': [{'message': {'content': request_json['id']}}]}
+
+    def _mock_count_tokens(text, model):
+        n_counts.append(text)
+        return 10
+
+    monkeypatch.setattr(ApiBase, "call_api", _mock_call_api)
+    monkeypatch.setattr(ApiBase, "count_tokens", _mock_count_tokens)
+    monkeypatch.setattr(elm.base.time, "sleep", lambda __: None)
+
+    requests = [{'model': 'gpt-4', 'id': str(i)} for i in range(3)]
+    queue = ApiQueue('url', {}, requests, rate_limit=1e9)
+    out = asyncio.run(queue.run())
+
+    assert [o['choices'][0]['message']['content'] for o in out] == [
+        '0', '1', '2']
+    assert len(calls) == 4
+    assert len(n_counts) == 3
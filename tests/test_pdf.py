@@ -3,6 +3,7 @@
 Test
 """
 import os
+import pytest
 from elm import TEST_DATA_DIR
 from elm.pdf import PDFtoTXT
 import elm.pdf
@@ -17,7 +18,7 @@ with open(FP_TXT, 'r', encoding='utf8') as f:
 
 
 class MockClass:
-    """Dummy class to mock requests.post"""
+    """Dummy class to mock requests.Session.post"""
 
     def __init__(self, **kwargs):
         self.kwargs = kwargs
@@ -32,7 +33,7 @@ class MockClass:
 
     @classmethod
     def call(cls, **kwargs):
-        """Mock for requests.post"""
+        """Mock for requests.Session.post"""
         return cls(**kwargs)
 
 
@@ -41,7 +42,7 @@ def test_pdf_txt_clean(mocker):
 
     Note that LLM-based text cleaning is mocked here and not actually tested.
     """
-    mocker.patch.object(elm.pdf.requests, "post", MockClass.call)
+    mocker.patch.object(elm.pdf.requests.Session, "post", MockClass.call)
     pdf = PDFtoTXT(FP_PDF)
     pdf.clean_txt()
 
@@ -49,3 +50,57 @@ def test_pdf_txt_clean(mocker):
     ntotal = len(TEXT.split(' '))
 
     assert (missing / ntotal) < 0.1
+
+
+def test_pdf_parallel_load():
+    """Test that parallel page extraction matches serial extraction"""
+    serial = PDFtoTXT(FP_PDF)
+    parallel = PDFtoTXT(FP_PDF, parallel=True)
+    assert len(serial.raw_pages) >= elm.pdf.MIN_PAGES_FOR_PARALLEL
+    assert parallel.raw_pages == serial.raw_pages
+
+
+def test_pdf_load_without_pymupdf(monkeypatch):
+    """Test that PDF loading falls back to PyPDF2 if PyMuPDF is missing"""
+    monkeypatch.setattr(elm.pdf, "pymupdf", None)
+    pdf = PDFtoTXT(FP_PDF, page_range=(1, 4), parallel=True)
+    assert len(pdf.raw_pages) == 3
+    assert all("GPT-4" in page for page in pdf.raw_pages)
+
+
+def test_pdf_clean_retries_api_errors(mocker, monkeypatch):
+    """Test that page cleaning retries API error responses"""
+    calls = []
+
+    def _flaky_call(session, **kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            return mocker.Mock(json=lambda: {'error': 'rate limit'})
+        return MockClass.call(**kwargs)
+
+    mocker.patch.object(elm.pdf.requests.Session, "post", _flaky_call)
+    monkeypatch.setattr(elm.pdf.time, "sleep", lambda __: None)
+    pdf = PDFtoTXT(FP_PDF, page_range=(0, 3))
+    clean_pages = pdf.clean_txt(max_workers=1)
+
+    assert len(calls) == 4
+    assert all(clean_pages)
+
+
+def test_pdf_clean_raises_after_max_retries(mocker, monkeypatch):
+    """Test that page cleaning raises once retries are exhausted"""
+    def _error_call(session, **kwargs):
+        return mocker.Mock(json=lambda: {'error': 'dummy error'})
+
+    mocker.patch.object(elm.pdf.requests.Session, "post", _error_call)
+    monkeypatch.setattr(elm.pdf.time, "sleep", lambda __: None)
+    pdf = PDFtoTXT(FP_PDF, page_range=(0, 1))
+    with pytest.raises(RuntimeError):
+        pdf.clean_txt(max_retries=2)
+
+
+def test_pdf_connection_pool_size():
+    """Test that the API connection pool is sized to max_workers"""
+    pdf = PDFtoTXT(FP_PDF, page_range=(0, 1), max_workers=4)
+    adapter = pdf._session.get_adapter(pdf.URL)
+    assert adapter._pool_maxsize == 4
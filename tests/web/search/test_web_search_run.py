@@ -4,8 +4,9 @@ from pathlib import Path
 
 import pytest
 
+import elm.web.search.run
 from elm.web.search.run import (_single_se_search, _down_select_urls,
-                                _init_se, _load_docs)
+                                _init_se, _load_docs, _run_search, _SE_OPT)
 from elm.web.search.google import (APIGoogleCSESearch,
                                    PlaywrightGoogleLinkSearch)
 from elm.exceptions import ELMKeyError
@@ -27,17 +28,24 @@ def test_down_select_urls_empty():
 
 def test_down_select_urls_empty_queries():
     """Test down selecting when all URLs results are empty"""
-    assert _down_select_urls([[[]], [[]]]) == set()
+    assert _down_select_urls([[], []]) == set()
 
 
 def test_down_select_urls_diff_lens():
     """Test down selecting URLs result lengths differ"""
-    assert _down_select_urls([[['ab']], [['bc', 'cd']]]) == {'ab', 'bc', 'cd'}
+    assert _down_select_urls([['ab'], ['bc', 'cd']]) == {'ab', 'bc', 'cd'}
 
 
 def test_down_select_urls_one_empty():
     """Test down selecting URLs when one result is empty"""
-    assert _down_select_urls([[[]], [['bc', 'cd']]]) == {'bc', 'cd'}
+    assert _down_select_urls([[], ['bc', 'cd']]) == {'bc', 'cd'}
+
+
+def test_down_select_urls_dedup_and_ignore():
+    """Test down selecting URLs with duplicates and ignored URL parts"""
+    results = [['ab', 'wiki_a', 'cd'], ['ab', 'bc', 'de']]
+    assert _down_select_urls(results, num_urls=3,
+                             ignore_url_parts="wiki") == {'ab', 'bc', 'cd'}
 
 
 def test_init_se():
@@ -75,5 +83,30 @@ async def test_single_se_search_bad_build():
     assert results == set()
 
 
+@pytest.mark.asyncio
+async def test_run_search_single_se_instance(monkeypatch):
+    """Test that all queries are run through a single SE instance"""
+
+    class DummySE:
+        """Dummy search engine"""
+        _SE_NAME = "Dummy"
+        instances = []
+
+        def __init__(self, **__):
+            self.instances.append(self)
+
+        async def results(self, *queries, num_results=10):
+            """Dummy search results"""
+            return [[f"{query}_{ind}" for ind in range(2)]
+                    for query in queries]
+
+    monkeypatch.setitem(elm.web.search.run.SEARCH_ENGINE_OPTIONS, "Dummy",
+                        _SE_OPT(DummySE, True, "pw_launch_kwargs"))
+
+    results = await _run_search("Dummy", ["a", "b", "c"], None, None, {})
+    assert len(DummySE.instances) == 1
+    assert results == [["a_0", "a_1"], ["b_0", "b_1"], ["c_0", "c_1"]]
+
+
 if __name__ == "__main__":
     pytest.main(["-q", "--show-capture=all", Path(__file__), "-rapP"])
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """ELM Web scraping utilities tests"""
+import asyncio
 from pathlib import Path
 
 import pytest
@@ -9,6 +10,7 @@ from elm.web.utilities import (
     clean_search_query,
     compute_fn_from_url,
     write_url_doc_to_file,
+    filter_documents,
 )
 
 
@@ -90,5 +92,27 @@ def test_write_url_doc_to_file(tmp_path):
     assert out_fp.name == "examplecom20test.txt"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrent", [None, 1, 2])
+async def test_filter_documents_max_concurrent(max_concurrent):
+    """Test `filter_documents` respects the concurrency limit"""
+
+    docs = [HTMLDocument([str(ind) * (ind + 1)]) for ind in range(5)]
+    running = []
+    peak = []
+
+    async def _check(doc):
+        running.append(doc)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.remove(doc)
+        return int(doc.text[0]) % 2 == 0
+
+    out = await filter_documents(docs, _check, max_concurrent=max_concurrent)
+
+    assert [doc.text[0] for doc in out] == ["0", "2", "4"]
+    assert max(peak) == (max_concurrent or len(docs))
+
+
 if __name__ == "__main__":
     pytest.main(["-q", "--show-capture=all", Path(__file__), "-rapP"])